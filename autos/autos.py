@@ -7,8 +7,15 @@ Author: Mahesh Venkitachalam
 """
 
 import argparse
-import math, random
-from PIL import Image, ImageDraw
+import math
+import numpy as np
+from PIL import Image
+
+# numba is optional - used to JIT the depth shift if available
+try:
+  from numba import njit, prange
+except ImportError:
+  njit = None
 
 # create spacing/depth example
 def createSpacingDepthExample():
@@ -23,38 +30,46 @@ def createSpacingDepthExample():
 
 # create image filled with random dots
 def createRandomTile(dims):
-  # create image
-  img = Image.new('RGB', dims)
-  draw = ImageDraw.Draw(img)
+  # create image data
+  W, H = dims
+  arr = np.zeros((H, W, 3), np.uint8)
   # calculate radius - % of min dimension 
   r = min(*dims) // 100  # radius
   # number of dots
   n = 1000
-  # draw random circles
-  for _ in range(n):
-    # -r is used so circle stays inside - cleaner for tiling
-    x, y = random.randint(0, dims[0]-r), random.randint(0, dims[1]-r) # center
-    fill = (random.randint(0, 255), random.randint(0, 255), 
-            random.randint(0, 255))
-    draw.ellipse((x-r, y-r, x+r, y+r), fill)
+  # disk mask - same for every circle, so build it once
+  yy, xx = np.ogrid[-r:r+1, -r:r+1]
+  disk = xx*xx + yy*yy <= r*r
+  # random centers and colors for all circles
+  # -r is used so circle stays inside - cleaner for tiling
+  xs = np.random.randint(0, W-r+1, n)
+  ys = np.random.randint(0, H-r+1, n)
+  fills = np.random.randint(0, 256, (n, 3)).astype(np.uint8)
+  # draw random circles, clipped to the image
+  for x, y, fill in zip(xs, ys, fills):
+    x0, x1 = max(x-r, 0), min(x+r+1, W)
+    y0, y1 = max(y-r, 0), min(y+r+1, H)
+    mask = disk[y0-y+r:y1-y+r, x0-x+r:x1-x+r]
+    arr[y0:y1, x0:x1][mask] = fill
   # return image
-  return img
+  return Image.fromarray(arr)
 
-# Create a larger image of size dims by tiling the given image
-def createTiledImage(tile, dims):
-  # create output image
-  img = Image.new('RGB', dims)
+# Tile an (h, w, 3) array to fill dims = (W, H)
+def tileArray(t, dims):
   W, H = dims
-  w, h = tile.size
+  h, w = t.shape[:2]
   # calculate # of tiles needed
   cols = math.ceil(W / w)
   rows = math.ceil(H / h)
-  # paste tiles
-  for i in range(rows):
-    for j in range(cols):
-      img.paste(tile, (j*w, i*h))
+  # repeat tile and crop to output size
+  return np.tile(t, (rows, cols, 1))[:H, :W]
+
+# Create a larger image of size dims by tiling the given image
+def createTiledImage(tile, dims):
+  # tile data as an RGB array
+  t = np.asarray(tile.convert('RGB'))
   # output image
-  return img
+  return Image.fromarray(tileArray(t, dims))
 
 # create a depth map for testing:
 def createDepthMap(dims):
@@ -64,40 +79,62 @@ def createDepthMap(dims):
   dmap.paste(20, (200, 275, 300, 375))
   return dmap
 
+# shift pixels of s (in place) based on depth map d, one row per thread
+if njit:
+  @njit(parallel=True, cache=True)
+  def shiftPixels(d, s, period):
+    rows, cols = d.shape
+    for j in prange(rows):
+      for i in range(cols):
+        xshift = d[j, i] // 10
+        xpos = i - period + xshift
+        if 0 < xpos < cols:
+          s[j, i] = s[j, xpos]
+
+# Shift pixels of array s in place according to depth array d
+def shiftArray(d, s, period):
+  if njit:
+    shiftPixels(d, s, period)
+    return s
+  # shift per pixel, based on depth map
+  xshift = d // 10
+  # shift pixels column by column - a pixel may copy from an already 
+  # shifted pixel to its left, so only the rows are vectorized
+  rows, cols = d.shape
+  for i in range(cols):
+    xpos = xshift[:, i].astype(np.intp) + (i - period)
+    m = (xpos > 0) & (xpos < cols)
+    s[m, i] = s[m, xpos[m]]
+  return s
+
 # Given a depth map (image) and an input image, create a new image
 # with pixels shifted according to depth
 def createDepthShiftedImage(dmap, img, period):
   # size check
   assert dmap.size == img.size
-  # create shifted image
-  sImg = img.copy()
-  # get pixel access
-  pixD = dmap.load()
-  pixS = sImg.load()
-  # shift pixels output based on depth map
-  cols, rows = sImg.size
-  for j in range(rows):
-    for i in range(cols):
-      xshift = pixD[i, j]/10
-      xpos = i - period + xshift
-      if 0 < xpos < cols:
-        pixS[i, j] = pixS[xpos, j]
+  # depth map is read as uint8 in place; the image is copied once into 
+  # the output buffer which is then shifted in place
+  d = np.asarray(dmap)
+  s = np.array(img)
   # return shifted image
-  return sImg
+  return Image.fromarray(shiftArray(d, s, period))
 
 # Given a depth map (image) and an input image, create a new image
 # with pixels shifted according to depth
 def createAutostereogram(dmap, tile=None):
   # convert depth map to single channel if needed
-  if dmap.mode is not 'L':
+  if dmap.mode != 'L':
     dmap = dmap.convert('L')
   # if no tile specified, use np.random image
   if not tile:
     tile = createRandomTile((100, 100))
-  # create an image by tiling
-  img = createTiledImage(tile, dmap.size)
+  # work on arrays, converting to an image only at the end
+  d = np.asarray(dmap)
+  t = np.asarray(tile.convert('RGB'))
+  # create an image by tiling - a fresh array, so shift it in place
+  s = tileArray(t, dmap.size)
   # return shifted image
-  return createDepthShiftedImage(dmap, img, tile.size[0])
+  return Image.fromarray(shiftArray(d, s, t.shape[1]))
 
 # main() function
 def main():
@@ -97,7 +97,7 @@ class Boids:
     def buttonPress(self, event):
         """event handler for matplotlib button presses"""
         # left click - add a boid
-        if event.button is 1:
+        if event.button == 1:
             self.pos = np.concatenate((self.pos, 
                                        np.array([[event.xdata, event.ydata]])), 
                                       axis=0)
@@ -107,7 +107,7 @@ class Boids:
             self.vel = np.concatenate((self.vel, v), axis=0)
             self.N += 1 
         # right click - scatter
-        elif event.button is 3:
+        elif event.button == 3:
             # add scattering velocity 
             self.vel += 0.1*(self.pos - np.array([[event.xdata, event.ydata]]))
         
@@ -96,6 +96,10 @@ class Scene:
                                                   b'uMVMatrix')
         # texture 
         self.tex2D = glGetUniformLocation(self.program, b'tex2D')
+        # angle and cut toggle
+        self.thetaUniform = glGetUniformLocation(self.program, b'uTheta')
+        self.showCircleUniform = glGetUniformLocation(self.program, 
+                                                      b'showCircle')
 
         # define triange strip vertices 
         vertexData = numpy.array(
@@ -122,6 +126,8 @@ class Scene:
 
         # time
         self.t = 0 
+        # angle in radians for each integer degree of self.t
+        self.thetaTable = [math.radians(i) for i in range(360)]
 
         # texture
         self.texId = glutils.loadTexture('star.png')
@@ -134,8 +140,7 @@ class Scene:
         # increment angle
         self.t = (self.t + 1) % 360
         # set shader angle in radians
-        glUniform1f(glGetUniformLocation(self.program, 'uTheta'), 
-                    math.radians(self.t))
+        glUniform1f(self.thetaUniform, self.thetaTable[self.t])
 
     # render 
     def render(self, pMatrix, mvMatrix):        
@@ -149,8 +154,7 @@ class Scene:
         glUniformMatrix4fv(self.mvMatrixUniform, 1, GL_FALSE, mvMatrix)
 
         # show circle?
-        glUniform1i(glGetUniformLocation(self.program, b'showCircle'), 
-                    self.showCircle)
+        glUniform1i(self.showCircleUniform, self.showCircle)
 
         # enable texture 
         glActiveTexture(GL_TEXTURE0)
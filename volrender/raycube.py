@@ -97,7 +97,7 @@ class RayCube:
                 7, 2, 3, 
                 4, 0, 5, 
                 5, 0, 1
-                ], numpy.int16)
+                ], numpy.uint16)
         
         self.nIndices = indices.size
 
@@ -136,9 +136,7 @@ class RayCube:
         # color
         glBindBuffer(GL_ARRAY_BUFFER, self.colorBuffer)
         glVertexAttribPointer(aColorLoc, 3, GL_FLOAT, GL_FALSE, 0, None)
-        # index
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.indexBuffer)
-        
+
         # unbind VAO
         glBindVertexArray(0)
 
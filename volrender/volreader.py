@@ -31,7 +31,7 @@ def loadVolume(dirName):
             imgData = np.array(img.getdata(), np.uint8)
 
             # check if all are of the same size
-            if count is 0:
+            if count == 0:
                 width, height = img.size[0], img.size[1] 
                 imgDataList.append(imgData)
             else: